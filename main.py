@@ -6,6 +6,21 @@ the optimizer is forked by
 https://github.com/xitorch/xitorch.git
 """
 
+import os
+
+########################################################################################################################
+# pin the number of BLAS/OpenMP threads before torch is imported.
+# torch and the libcint integrals of dqc don't run at the same time, but both bring their own OpenMP pool
+# and the idle threads of one pool keep spinning on the cores the other one is using.
+# Each gets half of the cores. This also limits the pyscf SCF calculations of this process.
+# Set OMP_NUM_THREADS / MKL_NUM_THREADS yourself to override it.
+########################################################################################################################
+
+_nthreads = str(max(1, (os.cpu_count() or 2) // 2))
+_omp_user_set = "OMP_NUM_THREADS" in os.environ  # torch reads a user value (e.g. "4,2") on its own
+os.environ.setdefault("OMP_NUM_THREADS", _nthreads)
+os.environ.setdefault("MKL_NUM_THREADS", _nthreads)
+
 from optb.optimize_basis import *
 from optb.output import merge_data
 from optb.data.preselected_avdata import elw417 ,elg2
@@ -19,7 +34,10 @@ import argparse
 def cuda_device_checker(memory=False):
     device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
     if memory is False:
-        print(f"Using device: {device, torch.version.cuda}\n{torch.cuda.get_device_name(0)}")
+        if device.type == 'cuda':
+            print(f"Using device: {device, torch.version.cuda}\n{torch.cuda.get_device_name(0)}")
+        else:
+            print(f"Using device: {device}")
     else:
         if device.type == 'cuda':
             print('Memory Usage:')
@@ -33,6 +51,8 @@ def cuda_device_checker(memory=False):
 ########################################################################################################################
 
 torch.set_printoptions(linewidth=200, precision=5)
+if not _omp_user_set:
+    torch.set_num_threads(int(_nthreads))
 
 
 if __name__ == "__main__":
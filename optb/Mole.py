@@ -9,6 +9,7 @@ import xitorch as xt
 from optb.MoleDQC import *
 from optb.MoleSCF import *
 from optb.AtomsDB import *
+from optb.projection import cross_atoms
 
 @dataclass
 class Molecarrier:
@@ -108,16 +109,11 @@ def Mole_minimizer(basis, ref_basis, atomstruc, **kwargs):
             number of elements of each basis set
 
         """
-        n_basis = 0
-        n_restbasis = 0
+        def _count(mole):
+            return sum(2 * el.angmom + 1 for atom in mole.atomstruc for el in mole.DQC.lbasis[atom[0]])
 
-        for i in range(len(system.atomstruc)):
-            for el in system.DQC.lbasis[system.atomstruc[i][0]]:
-                n_basis += 2 * el.angmom + 1
-
-            for el in ref_system.DQC.lbasis[ref_system.atomstruc[i][0]]:
-                n_restbasis += 2 * el.angmom + 1
-        return torch.tensor([n_basis, n_restbasis])
+        # plain ints, so that they can be used directly as slice indices of the overlap matrix
+        return _count(system), _count(ref_system)
 
     def system_dict(system, ref_system):
         """
@@ -134,16 +130,24 @@ def Mole_minimizer(basis, ref_basis, atomstruc, **kwargs):
         basis_ref = ref_system.DQC.lbasis
         bpacker_ref = xt.Packer(basis_ref)
         bparams_ref = bpacker_ref.get_param_tensor()
-        ref_basis = bpacker_ref.construct_from_tensor(bparams_ref)
+        ref_basis = bpacker_ref.construct_from_tensor(bparams_ref.detach())  # reference basis is not optimized
+
+        # only the occupied orbitals contribute to the projection,
+        # so they are selected once here instead of in every step of the minimizer
+        occ = ref_system.SCF.get_occ
+        occ_mask = occ > 0
+        occ_scf = occ[occ_mask]
 
         return {"bparams": bparams,
                 "bpacker": bpacker,
                 "ref_basis": ref_basis,
                 "atomstruc_dqc": system.DQC.atomstruc_dqc,
+                "atoms_cross": cross_atoms(system.DQC.atomstruc_dqc),
                 "atomstruc": system.DQC.atomstruc,
-                "coeffM": ref_system.SCF.get_coeff,
-                "mo_energy": ref_system.SCF.get_mo_energy,
-                "occ_scf": ref_system.SCF.get_occ,
+                "coeffM": ref_system.SCF.get_occ_coeff,
+                "mo_energy": ref_system.SCF.get_mo_energy[occ_mask],
+                "occ_scf": occ_scf,
+                "occ_sum": torch.sum(occ_scf),
                 "num_gauss": _num_gauss(system, ref_system)}
 
     return systopt, sys_ref, system_dict(systopt, sys_ref)
\ No newline at end of file
@@ -2,14 +2,43 @@
 def the MoleDQC Class which handles the DQC stuff
 """
 import warnings  # for warnings
+from dataclasses import replace
+from functools import lru_cache
 
 import dqc
 from dqc.utils.datastruct import AtomCGTOBasis
 import dqc.hamilton.intor as intor
 from dqc.api.parser import parse_moldesc
 
+import numpy as np
+
 from optb.get_element_arr import *
 
+
+@lru_cache(maxsize=None)
+def _read_basis(element, basis: str):
+    """
+    read the basis of an element from the dqc database only once per (element, basis).
+    :param element: element symbol or atomic number
+    :param basis: str name of the basis
+    :return: tuple of CGTOBasis
+    """
+    return tuple(dqc.loadbasis(f"{element}:{basis}", requires_grad=False))
+
+def _load_basis(element, basis: str, requires_grad=True):
+    """
+    load the basis of an element from the cache.
+    Each call gets its own tensors, so that the normalization or the optimization of one basis
+    does not change the cached one.
+    :param element: element symbol or atomic number
+    :param basis: str name of the basis
+    :param requires_grad: if true gradiant can be obtained to optimize basis.
+    :return: list of CGTOBasis
+    """
+    return [replace(b, alphas=b.alphas.detach().clone().requires_grad_(requires_grad),
+                    coeffs=b.coeffs.detach().clone().requires_grad_(requires_grad))
+            for b in _read_basis(element, basis)]
+
 class MoleDQC:
     def __init__(self, basis: str, atomstruc: list, elementsarr=None, rearrange=True, requires_grad=True):
         """
@@ -27,38 +56,33 @@ class MoleDQC:
         self.atomstruc = atomstruc
         self.atomstruc_dqc = self._arr_int_conv()
 
-        if elementsarr == None:
+        if elementsarr is None:
             self.elements = get_element_arr(self.atomstruc)
         else:
-            if type(elementsarr) is list:
+            if isinstance(elementsarr, (list, np.ndarray)):
                 self.elements = elementsarr
             else:
-                warnings.warn("elementsarr type is not list or None")
+                warnings.warn("elementsarr type is not list, numpy.ndarray or None")
 
         if rearrange == False:
-            if requires_grad == False:
-                basisparam = self._loadbasis(requires_grad=False)  # loaded dqc basis
-            else:
-                basisparam = self._loadbasis()
+            basisparam = self._loadbasis(requires_grad=requires_grad)  # loaded dqc basis
         else:
-            if requires_grad == False:
-                basisparam = self._rearrange_basis(requires_grad=False)  # loaded dqc basis
-            else:
-                basisparam = self._rearrange_basis()
+            basisparam = self._rearrange_basis(requires_grad=requires_grad)
 
         self.lbasis = basisparam  # basis with parameters in dqc format
 
     def _arr_int_conv(self):
         """
         converts the atomsruc array to an str for dqc
+        atoms can be given as [element, [x, y, z]] or [element, x, y, z]
         :return: str
         """
-        return (str(self.atomstruc).replace("[", " ")
-                .replace("]", " ")
-                .replace("'", "")
-                .replace(" , ", ";")
-                .replace(",", "")
-                .replace("  ", " "))
+        atoms = []
+        for el, *pos in self.atomstruc:
+            if len(pos) == 1:
+                pos = pos[0]
+            atoms.append(f"{el} {pos[0]} {pos[1]} {pos[2]}")
+        return "; ".join(atoms)
 
     def _loadbasis(self, **kwargs):
         """
@@ -73,18 +97,16 @@ class MoleDQC:
         """
 
         if type(self.basis) is str:
-            bdict = {}
-            for i in range(len(self.elements)):
-                bdict[el_dict[self.elements[i]]] = dqc.loadbasis(f"{self.elements[i]}:{self.basis}", **kwargs)
-            return bdict
+            basisnames = [self.basis] * len(self.elements)
         elif type(self.basis) is dict:
-            bdict = {}
-            for i in range(len(self.basis)):
-                bdict[el_dict[self.elements[i]]] = dqc.loadbasis(
-                    f"{self.elements[i]}:{self.basis[el_dict[self.elements[i]]]}", **kwargs)
-            return bdict
+            basisnames = [self.basis[z_to_symbol[el]] for el in self.elements]
         else:
             print("do nothing to load basis")
+            return None
+
+        # every element gets its basis once, even if it occurs multiple times in the molecule
+        return {z_to_symbol[el]: _load_basis(el, basisname, **kwargs)
+                for el, basisname in dict.fromkeys(zip(self.elements, basisnames))}
 
     def _rearrange_basis(self, **kwargs):
         """
@@ -7,11 +7,13 @@ import warnings  # for warnings
 import os
 import torch
 import basis_set_exchange as bse  # basest set exchange library
+import numpy as np
+
 from optb.get_element_arr import *
 
 
 class MoleSCF:
-    def __init__(self, basis: str, atomstruc: list, elementsarr=None, atomstrucstr = None ):
+    def __init__(self, basis: str, atomstruc: list, elementsarr=None, atomstrucstr = None, verbose = 3):
         """
         MoleSCF provides all relevant data for the basis optimization that refers to pyscf
         A mol type Object will be created as well as a restricted kohn sham
@@ -21,6 +23,8 @@ class MoleSCF:
                              ['H',  [-0.5, 0.0, 0.0]],
                              ['He', [0.0, 0.5, 0.0]]]
         :param elementsarr: provides information witch elements are in the system eg. H takes element number 1
+        :param atomstrucstr: name of the molecule, used for the name of the scf output file
+        :param verbose: verbose level of the pyscf output file (6 for a detailed debug log)
         """
 
         self.basis = basis  # just str of basis
@@ -30,17 +34,18 @@ class MoleSCF:
         if elementsarr is None:
             self.elements = get_element_arr(self.atomstruc)
         else:
-            if type(elementsarr) is list:
+            if isinstance(elementsarr, (list, np.ndarray)):
                 self.elements = elementsarr
             else:
-                warnings.warn("elementsarr type is not list or None")
+                warnings.warn("elementsarr type is not list, numpy.ndarray or None")
 
         self.basis = basis  # just str of basis
         self.atomstruc = atomstruc
 
         self.molbasis = None
         self.xc = "B3LYP"
-        self.mol = self._create_Mol()
+        self.verbose = verbose
+        self.mol = self._create_Mol(verbose = self.verbose)
         self.dft = self.dft_calc()
 
     def _get_molbasis_fparser(self):
@@ -71,10 +76,13 @@ class MoleSCF:
         bdict = {}
 
         for i in range(len(self.elements)):  # assign the basis to the associated elements
+            if str(z_to_symbol[self.elements[i]]) in bdict:
+                continue  # element occurs multiple times, its basis is already parsed
+
             if isinstance(self.basis, str):
                 basisname = _normalize_basisname(self.basis)
             else:
-                basisname = _normalize_basisname(self.basis[el_dict[self.elements[i]]])
+                basisname = _normalize_basisname(self.basis[z_to_symbol[self.elements[i]]])
                 # takes care if basis is not str
                 # instead it can be dict
 
@@ -88,9 +96,9 @@ class MoleSCF:
             if not os.path.exists(f"{basisfolder}/{basisname}.{self.elements[i]}.nw"):
                 # check if basis file already exists
                 # if False it will be downloaded and stored to NWChemBasis folder
-                print(f"No basis {self.basis} found for {el_dict[self.elements[i]]}."
+                print(f"No basis {self.basis} found for {z_to_symbol[self.elements[i]]}."
                       f" Try to get it from https://www.basissetexchange.org/")
-                basis = bse.get_basis(self.basis, elements=[el_dict[self.elements[i]]], fmt="nwchem")
+                basis = bse.get_basis(self.basis, elements=[z_to_symbol[self.elements[i]]], fmt="nwchem")
                 fname = f"{basisfolder}/{basisname}.{self.elements[i]}.nw"
                 with open(fname, "w") as f:
                     f.write(basis)
@@ -98,7 +106,7 @@ class MoleSCF:
                 print(f"Downloaded to {os.path.abspath(fname)}")
 
             file = open(f"{basisfolder}/{basisname}.{self.elements[i]}.nw").read()
-            bdict[str(el_dict[self.elements[i]])] = gto.basis.parse(file, optimize=False)
+            bdict[str(z_to_symbol[self.elements[i]])] = gto.basis.parse(file, optimize=False)
         return bdict
 
     def _create_Mol(self, **kwargs):
@@ -115,7 +123,7 @@ class MoleSCF:
         if "verbose" in kwargs:
             mol.verbose = kwargs["verbose"]
         else:
-            mol.verbose = 6
+            mol.verbose = 3
         if "symmetry" in kwargs:
             mol.symmetry = kwargs["symmetry"]
         else:
@@ -173,48 +181,48 @@ class MoleSCF:
         """
         :return: dict of all basis for the particular elements
         """
-        return self._get_molbasis_fparser()
+        return self.molbasis
 
     @property
     def get_coeff(self):
         """
         :return: torch.Tensor, coefficient matrix from the dft calculation.
         """
-        return torch.tensor(self.dft.mo_coeff)
+        return torch.tensor(self.dft.mo_coeff, dtype=torch.float64)
 
     @property
     def get_mo_energy(self):
         """
         :return: torch.Tensor, molecular orbital energies
         """
-        return torch.tensor(self.dft.mo_energy)
+        return torch.tensor(self.dft.mo_energy, dtype=torch.float64)
     @property
     def get_occ_coeff(self):
         """
          coefficient- matrix of just the occupied orbitals
         """
-        return self.get_coeff[self.get_occ > 0]
+        return torch.tensor(self.dft.mo_coeff[:, self.dft.mo_occ > 0], dtype=torch.float64)
 
     @property
     def get_mol(self):
         """
         :return: pyscf mole object
         """
-        return self._create_Mol()
+        return self.mol
 
     @property
     def get_occ(self):
         """
         :return: occupied orbitals
         """
-        return torch.tensor(self.dft.get_occ())
+        return torch.tensor(self.dft.mo_occ, dtype=torch.float64)  # stored by the kernel, no need to recompute it
 
     @property
     def get_ovlp(self):
         """
         :return: overlap matrix of a given mol object
         """
-        return torch.Tensor(self.mol.get_ovlp()).type(torch.float64)
+        return torch.tensor(self.mol.get_ovlp(), dtype=torch.float64)
 
     @property
     def get_tot_energy(self):
@@ -2,135 +2,18 @@
 provides all relevant data to get optb Obj.
 """
 
-el_dict = {1: 'H', 'H': 1,
-           2: 'He', 'He': 2,
-           3: 'Li', 'Li': 3,
-           4: 'Be', 'Be': 4,
-           5: 'B', 'B': 5,
-           6: 'C', 'C': 6,
-           7: 'N', 'N': 7,
-           8: 'O', 'O': 8,
-           9: 'F', 'F': 9,
-           10: 'Ne', 'Ne': 10,
-           11: 'Na', 'Na': 11,
-           12: 'Mg', 'Mg': 12,
-           13: 'Al', 'Al': 13,
-           14: 'Si', 'Si': 14,
-           15: 'P', 'P': 15,
-           16: 'S', 'S': 16,
-           17: 'Cl', 'Cl': 17,
-           18: 'Ar', 'Ar': 18,
-           19: 'K', 'K': 19,
-           20: 'Ca', 'Ca': 20,
-           21: 'Sc', 'Sc': 21,
-           22: 'Ti', 'Ti': 22,
-           23: 'V', 'V': 23,
-           24: 'Cr', 'Cr': 24,
-           25: 'Mn', 'Mn': 25,
-           26: 'Fe', 'Fe': 26,
-           27: 'Co', 'Co': 27,
-           28: 'Ni', 'Ni': 28,
-           29: 'Cu', 'Cu': 29,
-           30: 'Zn', 'Zn': 30,
-           31: 'Ga', 'Ga': 31,
-           32: 'Ge', 'Ge': 32,
-           33: 'As', 'As': 33,
-           34: 'Se', 'Se': 34,
-           35: 'Br', 'Br': 35,
-           36: 'Kr', 'Kr': 36,
-           37: 'Rb', 'Rb': 37,
-           38: 'Sr', 'Sr': 38,
-           39: 'Y', 'Y': 39,
-           40: 'Zr', 'Zr': 40,
-           41: 'Nb', 'Nb': 41,
-           42: 'Mo', 'Mo': 42,
-           43: 'Tc', 'Tc': 43,
-           44: 'Ru', 'Ru': 44,
-           45: 'Rh', 'Rh': 45,
-           46: 'Pd', 'Pd': 46,
-           47: 'Ag', 'Ag': 47,
-           48: 'Cd', 'Cd': 48,
-           49: 'In', 'In': 49,
-           50: 'Sn', 'Sn': 50,
-           51: 'Sb', 'Sb': 51,
-           52: 'Te', 'Te': 52,
-           53: 'I', 'I': 53,
-           54: 'Xe', 'Xe': 54,
-           55: 'Cs', 'Cs': 55,
-           56: 'Ba', 'Ba': 56,
-           57: 'La', 'La': 57,
-           58: 'Ce', 'Ce': 58,
-           59: 'Pr', 'Pr': 59,
-           60: 'Nd', 'Nd': 60,
-           61: 'Pm', 'Pm': 61,
-           62: 'Sm', 'Sm': 62,
-           63: 'Eu', 'Eu': 63,
-           64: 'Gd', 'Gd': 64,
-           65: 'Tb', 'Tb': 65,
-           66: 'Dy', 'Dy': 66,
-           67: 'Ho', 'Ho': 67,
-           68: 'Er', 'Er': 68,
-           69: 'Tm', 'Tm': 69,
-           70: 'Yb', 'Yb': 70,
-           71: 'Lu', 'Lu': 71,
-           72: 'Hf', 'Hf': 72,
-           73: 'Ta', 'Ta': 73,
-           74: 'W', 'W': 74,
-           75: 'Re', 'Re': 75,
-           76: 'Os', 'Os': 76,
-           77: 'Ir', 'Ir': 77,
-           78: 'Pt', 'Pt': 78,
-           79: 'Au', 'Au': 79,
-           80: 'Hg', 'Hg': 80,
-           81: 'Tl', 'Tl': 81,
-           82: 'Pb', 'Pb': 82,
-           83: 'Bi', 'Bi': 83,
-           84: 'Po', 'Po': 84,
-           85: 'At', 'At': 85,
-           86: 'Rn', 'Rn': 86,
-           87: 'Fr', 'Fr': 87,
-           88: 'Ra', 'Ra': 88,
-           89: 'Ac', 'Ac': 89,
-           90: 'Th', 'Th': 90,
-           91: 'Pa', 'Pa': 91,
-           92: 'U', 'U': 92,
-           93: 'Np', 'Np': 93,
-           94: 'Pu', 'Pu': 94,
-           95: 'Am', 'Am': 95,
-           96: 'Cm', 'Cm': 96,
-           97: 'Bk', 'Bk': 97,
-           98: 'Cf', 'Cf': 98,
-           99: 'Es', 'Es': 99,
-           100: 'Fm', 'Fm': 100,
-           101: 'Md', 'Md': 101,
-           102: 'No', 'No': 102,
-           103: 'Lr', 'Lr': 103,
-           104: 'Rf', 'Rf': 104,
-           105: 'Db', 'Db': 105,
-           106: 'Sg', 'Sg': 106,
-           107: 'Bh', 'Bh': 107,
-           108: 'Hs', 'Hs': 108,
-           109: 'Mt', 'Mt': 109,
-           110: 'Ds', 'Ds': 110,
-           111: 'Rg', 'Rg': 111,
-           112: 'Cn', 'Cn': 112,
-           113: 'Nh', 'Nh': 113,
-           114: 'Fl', 'Fl': 114,
-           115: 'Mc', 'Mc': 115,
-           116: 'Lv', 'Lv': 116,
-           117: 'Ts', 'Ts': 117,
-           118: 'Og', 'Og': 118}
+z_to_symbol = (None,  # index 0 is no element, so that z_to_symbol[Z] gives the symbol of the atomic number Z
+               'H', 'He', 'Li', 'Be', 'B', 'C', 'N', 'O', 'F', 'Ne',
+               'Na', 'Mg', 'Al', 'Si', 'P', 'S', 'Cl', 'Ar', 'K', 'Ca',
+               'Sc', 'Ti', 'V', 'Cr', 'Mn', 'Fe', 'Co', 'Ni', 'Cu', 'Zn',
+               'Ga', 'Ge', 'As', 'Se', 'Br', 'Kr', 'Rb', 'Sr', 'Y', 'Zr',
+               'Nb', 'Mo', 'Tc', 'Ru', 'Rh', 'Pd', 'Ag', 'Cd', 'In', 'Sn',
+               'Sb', 'Te', 'I', 'Xe', 'Cs', 'Ba', 'La', 'Ce', 'Pr', 'Nd',
+               'Pm', 'Sm', 'Eu', 'Gd', 'Tb', 'Dy', 'Ho', 'Er', 'Tm', 'Yb',
+               'Lu', 'Hf', 'Ta', 'W', 'Re', 'Os', 'Ir', 'Pt', 'Au', 'Hg',
+               'Tl', 'Pb', 'Bi', 'Po', 'At', 'Rn', 'Fr', 'Ra', 'Ac', 'Th',
+               'Pa', 'U', 'Np', 'Pu', 'Am', 'Cm', 'Bk', 'Cf', 'Es', 'Fm',
+               'Md', 'No', 'Lr', 'Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt', 'Ds',
+               'Rg', 'Cn', 'Nh', 'Fl', 'Mc', 'Lv', 'Ts', 'Og')
 
-#
-# import pymatgen.core.periodic_table as peri
-# def Elementdict():
-#     """
-#     create a dictionary for the elements and their numbers in the periodic table.
-#     """
-#     elementdict = {}
-#     for i in range(1, 119):  # all Elements of the periodic table (24.11.2021) in Dict
-#         elementdict[peri.Element.from_Z(i).number] = str(peri.Element.from_Z(i))
-#         elementdict[str(peri.Element.from_Z(i))] = peri.Element.from_Z(i).number
-#     return elementdict
-# element_dict = Elementdict()
-# print(element_dict)
+symbol_to_z = {symbol: z for z, symbol in enumerate(z_to_symbol) if symbol is not None}
@@ -2,15 +2,14 @@
 extract array of elements out of a given atom-structure
 """
 
-from optb.data.params_periodic_system import el_dict  # contains dict with all numbers and Symbols of the periodic table
+import numpy as np
+
+# tables of all numbers and Symbols of the periodic table
+from optb.data.params_periodic_system import z_to_symbol, symbol_to_z
 
 def get_element_arr(atomstruc):
     """
-    create array with all elements in the optb
+    create array with the atomic numbers of all elements in the optb
     """
-    elements_arr = [atomstruc[i][0] for i in range(len(atomstruc))]
-    for i in range(len(elements_arr)):
-        if type(elements_arr[i]) is str:
-            elements_arr[i] = el_dict[elements_arr[i]]
-    return elements_arr
-
+    return np.fromiter((symbol_to_z[atom[0]] if type(atom[0]) is str else int(atom[0]) for atom in atomstruc),
+                       dtype=int, count=len(atomstruc))
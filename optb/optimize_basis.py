@@ -245,12 +245,12 @@ class OPTBASIS:
                                         func_dict["bparams"],
                                         (func_dict["bpacker"],
                                          func_dict["ref_basis"],
-                                         func_dict["atomstruc_dqc"],
+                                         func_dict["atoms_cross"],
                                          func_dict["atomstruc"],
                                          func_dict["coeffM"],
                                          func_dict["mo_energy"],
                                          func_dict["occ_scf"],
-                                         func_dict["num_gauss"],),
+                                         func_dict["occ_sum"],),
                                         **min_dict)
 
         if self.get_misc:
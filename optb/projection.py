@@ -4,6 +4,8 @@ Basis Sets.
 """
 
 
+from typing import Union
+
 import torch
 from xitorch._core.packer import Packer
 from dqc.hamilton.intor import  overlap, LibcintWrapper
@@ -25,7 +27,7 @@ def blister(atomstruc : list, basis : dict, refbasis :dict):
     bref_arr = [refbasis[elem[i]] for i in range(len(elem))]
     return b_arr + bref_arr
 
-def cross_select(crossmat : torch.Tensor, num_gauss : torch.Tensor):
+def cross_select(crossmat : torch.Tensor, num_gauss : tuple):
     """
     select the cross overlap matrix part.
         S  = [b1*b1 , b1*b2] = [S_11 , S_12]
@@ -33,16 +35,48 @@ def cross_select(crossmat : torch.Tensor, num_gauss : torch.Tensor):
     :param crossmat: crossoverlap mat
     :param num_gauss: number of gaussians in two basis
     :return: torch.Tensor
-    returns the cross overlap matrices between the new and the old basis func
+    returns the cross overlap matrices (views of crossmat) between the new and the old basis func
     """
+    n0 = num_gauss[0]
 
-    S_11 = crossmat[0:num_gauss[0],0:num_gauss[0]]
-    S_12 = crossmat[num_gauss[0]:, 0:(len(crossmat) - num_gauss[1])]
-    S_21 = crossmat[0:num_gauss[0], num_gauss[0]:]
-    S_22 = crossmat[num_gauss[0]:, num_gauss[0]:]
+    S_11 = crossmat[:n0, :n0]
+    S_12 = crossmat[:n0, n0:]
+    S_21 = crossmat[n0:, :n0]
+    S_22 = crossmat[n0:, n0:]
     return S_11, S_12, S_21, S_22
 
-def crossoverlap(atomstruc : str, basis : list):
+def cross_atoms(atomstruc : str):
+    """
+    parse the atom structure once and double it, so that it can be used for both basis sets of the crossoverlap.
+    The atoms don't move during the optimization, therefore this has to be done just once.
+    :param atomstruc: molecular structure in dqc format
+    :return: list of tuples (atomz: int Atomic number, pos: torch.tensor atom position) for each atom
+    """
+    atomzs, atompos = parse_moldesc(atomstruc)
+
+    # atomzs : Atomic number (torch.tensor); len: number of Atoms
+    # atompos : atom positions tensor of shape (3x len: number of Atoms )
+    # split them per atom once, so that they don't have to be indexed in every step.
+    # now double the atom information to use is for the second basis set
+
+    atoms = list(zip(atomzs.tolist(), atompos))
+    return atoms + atoms
+
+def _atombases(atomstruc : Union[str, list], basis : list):
+    """
+    creates a list with AtomCGTOBasis object for each atom of both basis sets
+    :param atomstruc: molecular structure in dqc format or the output of cross_atoms
+    :param basis: list of basis sets eg. [b1, b2] (see crossoverlap)
+    :return: list of AtomCGTOBasis
+    """
+    if type(atomstruc) is str:
+        atoms = cross_atoms(atomstruc)
+    else:
+        atoms = atomstruc
+
+    return [AtomCGTOBasis(atomz=atomz, bases=b, pos=pos) for (atomz, pos), b in zip(atoms, basis)]
+
+def crossoverlap(atomstruc : Union[str, list], basis : list):
     """
     calculate the cross overlap matrix between to basis functions.
     The corssoverlap is defined by the overlap between to basis sets.
@@ -51,7 +85,7 @@ def crossoverlap(atomstruc : str, basis : list):
     Then is the crossoveralp S:
         S  = [b1*b1 , b1*b2] = [S_11 , S_12]
              [b2*b1 , b2*b2]   [S_21 , S_22]
-    :if not self.normalized:param atomstruc: molecular structure in dqc format
+    :param atomstruc: molecular structure in dqc format or the output of cross_atoms
     :param basis: list of basis sets eg. [b1, b2] where b1 is the basis that is going to be optimized and
                   b2 is the reference basis.
     :return: torch.Tensor shape (len(b1)+len(b2)) x (len(b1)+len(b2))
@@ -61,36 +95,83 @@ def crossoverlap(atomstruc : str, basis : list):
 
     # calculate cross overlap matrix:
 
-    atomzs, atompos = parse_moldesc(atomstruc)
-
-    # atomzs : Atomic number (torch.tensor); len: number of Atoms
-    # atompos : atom positions tensor of shape (3x len: number of Atoms )
-    # now double both atom information to use is for the second basis set
-
-    atomzs = torch.cat([atomzs, atomzs])
-    atompos = torch.cat([atompos, atompos])
-    atombases = [AtomCGTOBasis(atomz=atomzs[i], bases=basis[i], pos=atompos[i]) for i in range(len(basis))]
+    atombases = _atombases(atomstruc, basis)
 
     # creates a list with AtomCGTOBasis object for each atom (including  all previous information in one array element)
     wrap = LibcintWrapper(
         atombases)  # creates a wrapper object to pass information on lower functions
     return overlap(wrap)
 
-def projection_mat(coeff : torch.Tensor, colap : torch.Tensor, num_gauss : torch.Tensor):
+def crossoverlap_blocks(atomstruc : Union[str, list], basis : list):
+    """
+    calculate just the parts S_11 and S_12 of the crossoverlap (see crossoverlap).
+    The projection does not need S_21 = S_12^T nor the overlap of the reference basis S_22,
+    which is the biggest part of the crossoverlap, so they are not calculated.
+    :param atomstruc: molecular structure in dqc format or the output of cross_atoms
+    :param basis: list of basis sets eg. [b1, b2] where b1 is the basis that is going to be optimized and
+                  b2 is the reference basis.
+    :return: tuple of torch.Tensor S_11 (len(b1) x len(b1)) and S_12 (len(b1) x len(b2))
+    """
+
+    atombases = _atombases(atomstruc, basis)
+    natoms = len(atombases) // 2
+
+    # one wrapper for both basis sets, split by the number of shells of the first one.
+    # Both subsets share this parent, which is needed for the integrals between them.
+    wrap_all = LibcintWrapper(atombases)
+    n_sh = sum(len(b) for b in basis[:natoms])
+    wrap, wrap_ref = wrap_all[:n_sh], wrap_all[n_sh:]
+    return overlap(wrap), overlap(wrap, other=wrap_ref)
+
+def projection_blocks(coeff : torch.Tensor, S_11 : torch.Tensor, S_12 : torch.Tensor):
     """
     Calculate the Projection from the old to the new Basis:
-         P = C^T S_12 S⁻¹_11 S_21 C
+         P = C^T S_21 S⁻¹_11 S_12 C = (S_12 C)^T S⁻¹_11 (S_12 C)
+    because the overlap is symmetric (S_21 = S_12^T)
+    :param coeff: coefficient matrix of the bigger reference basis calculated by pyscf (C Matrix in eq.)
+    :param S_11: overlap of the basis that is going to be optimized
+    :param S_12: overlap between the basis that is going to be optimized and the reference basis
+    :return: Projection Matrix
+    """
+    s12_c, s11_s12c = _projection_factors(coeff, S_11, S_12)
+    P = torch.matmul(s12_c.T, s11_s12c)
+    return P
+
+def projection_blocks_diag(coeff : torch.Tensor, S_11 : torch.Tensor, S_12 : torch.Tensor):
+    """
+    Calculate just the diagonal of the Projection (see projection_blocks)
+    without building the whole (n_occ x n_occ) matrix.
+    :param coeff: coefficient matrix of the bigger reference basis calculated by pyscf (C Matrix in eq.)
+    :param S_11: overlap of the basis that is going to be optimized
+    :param S_12: overlap between the basis that is going to be optimized and the reference basis
+    :return: diagonal of the Projection Matrix
+    """
+    s12_c, s11_s12c = _projection_factors(coeff, S_11, S_12)
+    return torch.sum(s12_c * s11_s12c, dim=0)
+
+def _projection_factors(coeff : torch.Tensor, S_11 : torch.Tensor, S_12 : torch.Tensor):
+    """
+    factors of the Projection P = (S_12 C)^T (S⁻¹_11 S_12 C)
+    :return: tuple of S_12 C and S⁻¹_11 S_12 C
+    """
+    # coeff only holds the occupied orbitals, so every intermediate is just (n_basis x n_occ)
+    s12_c = torch.matmul(S_12, coeff)
+    # S_11 is an overlap matrix (symmetric positive definite) so solve with its cholesky factor
+    # instead of forming the inverse
+    L = torch.linalg.cholesky(S_11)
+    s11_s12c = torch.cholesky_solve(s12_c, L)
+    return s12_c, s11_s12c
+
+def projection_mat(coeff : torch.Tensor, colap : torch.Tensor, num_gauss : tuple):
+    """
+    Calculate the Projection from the old to the new Basis out of the whole crossoverlap (see projection_blocks)
     :param coeff: coefficient matrix of the bigger reference basis calculated by pyscf (C Matrix in eq.)
     :param colap: crossoverlap Matrix (S and his parts)
     :param num_gauss: array with length of the basis sets
     :return: Projection Matrix
     """
-    S_11, S_12, S_21, _ = cross_select(colap, num_gauss)
-    s21_c = torch.matmul(S_21, coeff)
-    s11_s21c = torch.matmul(torch.inverse(S_11), s21_c)
-    s21_s11s12c = torch.matmul(S_12, s11_s21c)
-    P = torch.matmul(coeff.T, s21_s11s12c)
-    return P
+    S_11, S_12, _, _ = cross_select(colap, num_gauss)
+    return projection_blocks(coeff, S_11, S_12)
 
 """
 Function for the Projection between two basis function.
@@ -98,7 +179,7 @@ This function will be optimized by the xitorch minimizer.
 """
 
 def projection_(bparams: torch.Tensor, bpacker: Packer, ref_basis
-        , atomstruc_dqc: str, atomstruc: list, coeffM: torch.Tensor, occ_scf: torch.Tensor, num_gauss: torch.Tensor):
+        , atomstruc_dqc: str, atomstruc: list, coeffM: torch.Tensor, occ_scf: torch.Tensor, num_gauss: tuple):
     """
     Function to optimize
     :param bparams: torch.tensor with coeff of basis set for the basis that has to been optimized
@@ -130,14 +211,19 @@ def projection_(bparams: torch.Tensor, bpacker: Packer, ref_basis
     return -torch.trace(_projection) / torch.sum(occ_scf)
 
 def projection(bparams: torch.Tensor, bpacker: Packer, ref_basis
-        , atomstruc_dqc: str, atomstruc: list, coeffM: torch.Tensor,mo_energy : torch.Tensor ,occ_scf: torch.Tensor, num_gauss: torch.Tensor):
+        , atoms_cross: tuple, atomstruc: list, coeffM: torch.Tensor,mo_energy : torch.Tensor ,occ_scf: torch.Tensor,
+               occ_sum: torch.Tensor):
     """
     Function to optimize
     :param bparams: torch.tensor with coeff of basis set for the basis that has to been optimized
     :param bpacker: xitorch._core.packer.Packer object to create the CGTOBasis out of the bparams
     :param bparams_ref: torch.tensor like bparams but now for the refenrenence basis on which to optimize.
     :param bpacker_ref: xitorch._core.packer.Packer like Packer but now for the refenrenence basis on which to optimize.
-    :param atomstruc_dqc: string of atom structure
+    :param atoms_cross: doubled list of atomz and position of each atom (see cross_atoms)
+    :param coeffM: coefficient matrix of the occupied orbitals of the reference basis
+    :param mo_energy: molecular orbital energies of the occupied orbitals
+    :param occ_scf: occupation numbers of the occupied orbitals
+    :param occ_sum: sum of occ_scf
     :return:
     """
 
@@ -146,17 +232,15 @@ def projection(bparams: torch.Tensor, bpacker: Packer, ref_basis
 
     basis_cross = blister(atomstruc, basis, ref_basis)
 
-    colap = crossoverlap(atomstruc_dqc, basis_cross)
+    S_11, S_12 = crossoverlap_blocks(atoms_cross, basis_cross)
 
     # maximize overlap
 
-    _projt = projection_mat(coeffM, colap, num_gauss)
-
-    occ_scf = occ_scf[occ_scf > 0]
-    len_occ = len(occ_scf)
+    # only the diagonal of the projection enters the trace
+    _projt = projection_blocks_diag(coeffM, S_11, S_12)
 
-    _projection = torch.mul(_projt[:, : len_occ], torch.mul(occ_scf, mo_energy[:len_occ].detach()))
+    _projection = _projt * torch.mul(occ_scf, mo_energy.detach())
 
-    return torch.trace(_projection) / torch.sum(occ_scf)
+    return torch.sum(_projection) / occ_sum
 
 